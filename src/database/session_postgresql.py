@@ -11,7 +11,13 @@ settings = get_settings()
 
 POSTGRESQL_DATABASE_URL = (f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@"
                            f"{settings.POSTGRES_HOST}:{settings.POSTGRES_DB_PORT}/{settings.POSTGRES_DB}")
-postgresql_engine = create_async_engine(POSTGRESQL_DATABASE_URL, echo=False)
+postgresql_engine = create_async_engine(
+    POSTGRESQL_DATABASE_URL,
+    echo=False,
+    # Compiled-statement cache sized well above the handful of hot
+    # statements so they are never evicted under load.
+    query_cache_size=1200
+)
 AsyncPostgresqlSessionLocal = sessionmaker(  # type: ignore
     bind=postgresql_engine,
     class_=AsyncSession,
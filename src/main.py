@@ -1,11 +1,13 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from routes import movie_router
 
 
 app = FastAPI(
     title="Movies homework",
-    description="Description of project"
+    description="Description of project",
+    default_response_class=ORJSONResponse
 )
 
 api_version_prefix = "/api/v1"
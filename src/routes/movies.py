@@ -1,13 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
-from sqlalchemy.exc import IntegrityError
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from database import get_db, MovieModel
-from database.models import CountryModel, GenreModel, ActorModel, LanguageModel
+from database import get_db
+from schemas import (
+    MovieCreateSchema,
+    MovieUpdateSchema
+)
+from services import crud
 
 
 router = APIRouter()
 
-# Write your code here
+
+@router.get("/movies/")
+async def list_movies(
+        page: int = Query(1, ge=1),
+        per_page: int = Query(10, ge=1, le=20),
+        cursor: Optional[str] = Query(None),
+        stream: bool = Query(False),
+        db: AsyncSession = Depends(get_db)
+) -> Response:
+    """
+    Retrieve a paginated list of movies.
+
+    Clients may either page with the legacy `page` parameter or follow the
+    `next_cursor` value from a previous response, which paginates by keyset
+    and stays fast on arbitrarily deep pages. With `stream=true` the
+    movies are instead streamed as NDJSON, one item per line, starting
+    after `cursor` when given - suited to exports where a single JSON
+    payload would not fit comfortably in memory.
+    """
+    if stream:
+        # Decoded here so a malformed cursor still yields a 400; inside the
+        # generator it would be too late, the 200 headers are already sent.
+        last_id = crud.decode_cursor(cursor) if cursor is not None else None
+        return StreamingResponse(
+            crud.stream_movies(db=db, per_page=per_page, last_id=last_id),
+            media_type="application/x-ndjson"
+        )
+    movie_list = await crud.get_movies(db=db, page=page, per_page=per_page, cursor=cursor)
+    return ORJSONResponse(movie_list)
+
+
+@router.get("/movies/{movie_id}/")
+async def get_movie(
+        movie_id: int,
+        db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
+    """
+    Retrieve detailed information about a single movie by its id.
+    """
+    return ORJSONResponse(await crud.get_movie_detail(db=db, movie_id=movie_id))
+
+
+@router.post("/movies/", status_code=201)
+async def create_movies(
+        movie_data: MovieCreateSchema,
+        db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
+    """
+    Create a new movie, creating any related country, genres, actors and
+    languages that do not exist yet.
+    """
+    movie = await crud.create_film(db=db, movie_data=movie_data)
+    return ORJSONResponse(crud.build_movie_detail(movie), status_code=201)
+
+
+@router.patch("/movies/{movie_id}/")
+async def update_movie(
+        movie_id: int,
+        movie_data: MovieUpdateSchema,
+        db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Apply a partial update to a movie by its id.
+    """
+    await crud.update_movie(db=db, movie_id=movie_id, movie_data=movie_data)
+    return {"detail": "Movie updated successfully."}
+
+
+@router.delete("/movies/{movie_id}/", status_code=204)
+async def delete_movie(
+        movie_id: int,
+        db: AsyncSession = Depends(get_db)
+) -> None:
+    """
+    Delete a movie by its id.
+    """
+    await crud.delete_movie(db=db, movie_id=movie_id)
@@ -1,5 +1,11 @@
 from schemas.movies import (
+    GenreSchema,
+    ActorSchema,
+    LanguageSchema,
+    CountrySchema,
     MovieDetailSchema,
     MovieListResponseSchema,
-    MovieListItemSchema
+    MovieListItemSchema,
+    MovieCreateSchema,
+    MovieUpdateSchema
 )
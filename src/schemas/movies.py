@@ -1 +1,115 @@
-# Write your code here
+import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from database.models import MovieStatusEnum
+
+_max_date_cache = [
+    datetime.date.today(),
+    datetime.date.today() + datetime.timedelta(days=365)
+]
+
+
+def _max_allowed_date() -> datetime.date:
+    """
+    Return the latest release date accepted on create, cached per day so
+    the threshold arithmetic is not redone for every inbound payload.
+    """
+    today = datetime.date.today()
+    if today != _max_date_cache[0]:
+        _max_date_cache[0] = today
+        _max_date_cache[1] = today + datetime.timedelta(days=365)
+    return _max_date_cache[1]
+
+
+class GenreSchema(BaseModel):
+    id: int
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActorSchema(BaseModel):
+    id: int
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LanguageSchema(BaseModel):
+    id: int
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CountrySchema(BaseModel):
+    id: int
+    code: str
+    name: Optional[str]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MovieBaseSchema(BaseModel):
+    name: str = Field(max_length=255)
+    date: datetime.date
+    score: float = Field(ge=0, le=100)
+    overview: str
+    status: MovieStatusEnum
+    budget: float = Field(ge=0)
+    revenue: float = Field(ge=0)
+
+
+class MovieListItemSchema(BaseModel):
+    id: int
+    name: str
+    date: datetime.date
+    score: float
+    overview: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MovieListResponseSchema(BaseModel):
+    movies: list[MovieListItemSchema]
+    prev_page: Optional[str] = None
+    next_page: Optional[str] = None
+    next_cursor: Optional[str] = None
+    total_pages: int
+    total_items: int
+
+
+class MovieDetailSchema(MovieBaseSchema):
+    id: int
+    country: CountrySchema
+    genres: list[GenreSchema]
+    actors: list[ActorSchema]
+    languages: list[LanguageSchema]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MovieCreateSchema(MovieBaseSchema):
+    country: str = Field(max_length=3)
+    genres: list[str]
+    actors: list[str]
+    languages: list[str]
+
+    @field_validator("date")
+    @classmethod
+    def date_validation(cls, value: datetime.date) -> datetime.date:
+        if value > _max_allowed_date():
+            raise ValueError("The date must not be more than one year in the future.")
+        return value
+
+
+class MovieUpdateSchema(BaseModel):
+    name: Optional[str] = Field(None, max_length=255)
+    date: Optional[datetime.date] = None
+    score: Optional[float] = Field(None, ge=0, le=100)
+    overview: Optional[str] = None
+    status: Optional[MovieStatusEnum] = None
+    budget: Optional[float] = Field(None, ge=0)
+    revenue: Optional[float] = Field(None, ge=0)
@@ -0,0 +1,571 @@
+import base64
+import binascii
+import math
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator, Optional
+
+import orjson
+
+from fastapi import HTTPException
+from sqlalchemy import select, func, desc, insert, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload, raiseload
+
+from database import MovieModel
+from database.models import (
+    ActorModel,
+    CountryModel,
+    GenreModel,
+    LanguageModel
+)
+from schemas import (
+    MovieCreateSchema,
+    MovieUpdateSchema
+)
+
+MOVIES_URL = "/theater/movies/"
+
+# Prebuilt once so the legacy page links only pay for the final
+# substitution, not for rebuilding the path on every request.
+_PAGE_URL_TEMPLATE = MOVIES_URL + "?page={page}&per_page={per_page}"
+
+OBJ_COUNT_CACHE_TTL = 5.0
+
+MOVIE_DETAIL_CACHE_TTL = 300.0
+
+MOVIE_DETAIL_CACHE_MAX = 1024
+
+_obj_count_cache: dict = {}
+
+_movie_detail_cache: OrderedDict = OrderedDict()
+
+# Hot statements are built once at import time so each request only binds
+# parameters instead of rebuilding and re-compiling the select() construct;
+# SQLAlchemy's compiled-statement cache then recognises the same construct
+# across calls. raiseload guards against silent lazy-load regressions: any
+# relation that is not eagerly loaded raises instead of issuing N+1 queries.
+_MOVIE_LOAD_OPTIONS = (
+    joinedload(MovieModel.country),
+    selectinload(MovieModel.genres),
+    selectinload(MovieModel.actors),
+    selectinload(MovieModel.languages),
+    raiseload("*"),
+)
+
+_MOVIE_LIST_STMT = (
+    select(MovieModel)
+    .order_by(desc(MovieModel.id))
+    .options(*_MOVIE_LOAD_OPTIONS)
+)
+
+_MOVIE_DETAIL_STMT = select(MovieModel).options(*_MOVIE_LOAD_OPTIONS)
+
+# The streaming export only emits list-item fields, so no relations are
+# loaded for it.
+_MOVIE_STREAM_STMT = select(MovieModel).order_by(desc(MovieModel.id))
+
+
+def invalidate_obj_count(model=None) -> None:
+    """
+    Drop the cached row count for `model`, or for all models when `model`
+    is None. Called after writes that change the number of rows.
+
+    :param model: The SQLAlchemy model class whose count became stale.
+    """
+    if model is None:
+        _obj_count_cache.clear()
+    else:
+        _obj_count_cache.pop(model, None)
+
+
+def invalidate_movie_detail(movie_id: Optional[int] = None) -> None:
+    """
+    Drop the cached detail payload for `movie_id`, or for all movies when
+    `movie_id` is None. Called after writes that change a movie.
+
+    :param movie_id: The id of the movie whose cached detail became stale.
+    """
+    if movie_id is None:
+        _movie_detail_cache.clear()
+    else:
+        _movie_detail_cache.pop(movie_id, None)
+
+
+def encode_cursor(movie_id: int) -> str:
+    """
+    Encode a movie id into an opaque pagination cursor.
+
+    :param movie_id: The id of the last movie on the current page.
+    :return: A URL-safe base64 string that can be passed back as `cursor`.
+    """
+    return base64.urlsafe_b64encode(str(movie_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode an opaque pagination cursor back into a movie id.
+
+    :param cursor: The cursor string received from a previous response.
+    :return: The movie id encoded in the cursor.
+    :raises HTTPException: 400 error if the cursor is malformed.
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+async def get_obj_count(db: AsyncSession, model) -> int:
+    """
+    Count the total number of rows for the given model.
+
+    The result is cached for a few seconds so that the full COUNT(*) scan
+    runs at most once per TTL window instead of on every list request.
+    Writes that change the row count invalidate the cache immediately via
+    `invalidate_obj_count`, so only concurrent external writes can be
+    observed with a slight delay.
+
+    :param db: The async database session.
+    :param model: The SQLAlchemy model class to count.
+    :return: The total number of rows.
+    """
+    cached = _obj_count_cache.get(model)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = await db.execute(select(func.count(model.id)))
+    count = result.scalar_one()
+    _obj_count_cache[model] = (time.monotonic() + OBJ_COUNT_CACHE_TTL, count)
+    return count
+
+
+async def get_movies(
+        db: AsyncSession,
+        page: int,
+        per_page: int,
+        cursor: Optional[str] = None
+) -> dict:
+    """
+    Retrieve a page of movies ordered by `id` descending.
+
+    When `cursor` is provided, keyset pagination is used: the page starts
+    right after the movie id encoded in the cursor, so retrieval cost stays
+    O(per_page) regardless of how deep the client has paged. The id column
+    is the primary key, so the seek predicate is index-backed. Without a
+    cursor the legacy offset-based `page` parameter is honoured for
+    backwards compatibility.
+
+    :param db: The async database session.
+    :param page: The 1-based page number (ignored when `cursor` is given).
+    :param per_page: The number of movies per page.
+    :param cursor: An opaque cursor pointing at the last seen movie.
+    :return: The movie list payload, shaped as MovieListResponseSchema.
+    :raises HTTPException: 404 error if the requested page has no movies.
+    """
+    total_items = await get_obj_count(db, MovieModel)
+    if not total_items:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    total_pages = math.ceil(total_items / per_page)
+
+    prev_page = None
+    next_page = None
+
+    if cursor is not None:
+        last_id = decode_cursor(cursor)
+        stmt = (
+            _MOVIE_LIST_STMT
+            .where(MovieModel.id < last_id)
+            .limit(per_page + 1)
+        )
+        result = await db.stream_scalars(stmt.execution_options(yield_per=per_page))
+        rows = [movie async for movie in result]
+        has_more = len(rows) > per_page
+        movies = rows[:per_page]
+        if not movies:
+            raise HTTPException(status_code=404, detail="No movies found.")
+    else:
+        stmt = (
+            _MOVIE_LIST_STMT
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        )
+        result = await db.stream_scalars(stmt.execution_options(yield_per=per_page))
+        movies = [movie async for movie in result]
+        if not movies:
+            raise HTTPException(status_code=404, detail="No movies found.")
+        has_more = page < total_pages
+        if page > 1:
+            prev_page = _PAGE_URL_TEMPLATE.format(page=page - 1, per_page=per_page)
+        if has_more:
+            next_page = _PAGE_URL_TEMPLATE.format(page=page + 1, per_page=per_page)
+
+    next_cursor = encode_cursor(movies[-1].id) if has_more else None
+
+    # The rows come straight from our own database, so the payload is
+    # assembled as plain dicts (shaped like MovieListResponseSchema) and
+    # handed directly to orjson, avoiding per-item model allocation on
+    # the hottest endpoint.
+    return {
+        "movies": [
+            {
+                "id": movie.id,
+                "name": movie.name,
+                "date": movie.date,
+                "score": movie.score,
+                "overview": movie.overview,
+            }
+            for movie in movies
+        ],
+        "prev_page": prev_page,
+        "next_page": next_page,
+        "next_cursor": next_cursor,
+        "total_pages": total_pages,
+        "total_items": total_items,
+    }
+
+
+async def stream_movies(
+        db: AsyncSession,
+        per_page: int,
+        last_id: Optional[int] = None
+) -> AsyncGenerator[bytes, None]:
+    """
+    Stream movies as NDJSON lines, one list item per line.
+
+    Rows are fetched with a server-side cursor in chunks of `per_page`
+    and each one is orjson-encoded as soon as it arrives, so peak memory
+    stays flat at one chunk regardless of how many movies are exported.
+    Starts from the newest movie, or right after `last_id` when given.
+
+    The caller must decode any client cursor to `last_id` before handing
+    this generator to a StreamingResponse: the generator body only runs
+    once the 200 headers are out, too late to turn a bad cursor into a
+    400.
+
+    :param db: The async database session.
+    :param per_page: The server-side fetch chunk size.
+    :param last_id: The id of the last seen movie, as decoded from a cursor.
+    :return: An async generator of NDJSON-encoded lines.
+    """
+    stmt = _MOVIE_STREAM_STMT
+    if last_id is not None:
+        stmt = stmt.where(MovieModel.id < last_id)
+
+    result = await db.stream_scalars(stmt.execution_options(yield_per=per_page))
+    async for movie in result:
+        yield orjson.dumps({
+            "id": movie.id,
+            "name": movie.name,
+            "date": movie.date,
+            "score": movie.score,
+            "overview": movie.overview,
+        }) + b"\n"
+
+
+async def get_movie_with_id(db: AsyncSession, movie_id: int) -> MovieModel:
+    """
+    Retrieve a single movie with all its related entities eagerly loaded.
+
+    :param db: The async database session.
+    :param movie_id: The id of the movie to retrieve.
+    :return: The movie instance.
+    :raises HTTPException: 404 error if no movie with the given id exists.
+    """
+    stmt = _MOVIE_DETAIL_STMT.where(MovieModel.id == movie_id)
+    result = await db.execute(stmt)
+    movie = result.scalars().first()
+    if not movie:
+        raise HTTPException(
+            status_code=404,
+            detail="Movie with the given ID was not found."
+        )
+    return movie
+
+
+def build_movie_detail(movie: MovieModel) -> dict:
+    """
+    Assemble the detail response payload from an ORM movie instance.
+
+    The data comes straight from our own database, so the payload is
+    built as plain dicts (shaped like MovieDetailSchema) with no
+    intermediate model allocation for the many small nested objects;
+    only `budget` needs an explicit cast since the DECIMAL column may
+    surface as Decimal depending on the driver.
+
+    :param movie: The movie instance with all relations loaded.
+    :return: The response payload, shaped as MovieDetailSchema.
+    """
+    return {
+        "id": movie.id,
+        "name": movie.name,
+        "date": movie.date,
+        "score": movie.score,
+        "overview": movie.overview,
+        "status": movie.status,
+        "budget": float(movie.budget),
+        "revenue": movie.revenue,
+        "country": {
+            "id": movie.country.id,
+            "code": movie.country.code,
+            "name": movie.country.name,
+        },
+        "genres": [
+            {"id": genre.id, "name": genre.name} for genre in movie.genres
+        ],
+        "actors": [
+            {"id": actor.id, "name": actor.name} for actor in movie.actors
+        ],
+        "languages": [
+            {"id": language.id, "name": language.name} for language in movie.languages
+        ],
+    }
+
+
+async def get_movie_detail(db: AsyncSession, movie_id: int) -> dict:
+    """
+    Return the detail response payload for a movie, read through a
+    short-TTL in-process cache.
+
+    A cache hit skips the database round-trips and payload assembly
+    entirely; misses fall through to `get_movie_with_id`. Entries are
+    invalidated by `update_movie` and `delete_movie`, so within one
+    process a stale read is impossible; the TTL bounds staleness against
+    writes from other processes. The cache is bounded: expired entries
+    are dropped when encountered and the least recently used entry is
+    evicted once MOVIE_DETAIL_CACHE_MAX distinct ids are cached.
+
+    :param db: The async database session.
+    :param movie_id: The id of the movie to retrieve.
+    :return: The response payload, shaped as MovieDetailSchema.
+    :raises HTTPException: 404 error if no movie with the given id exists.
+    """
+    cached = _movie_detail_cache.get(movie_id)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _movie_detail_cache.move_to_end(movie_id)
+            return cached[1]
+        del _movie_detail_cache[movie_id]
+
+    movie = await get_movie_with_id(db, movie_id)
+    payload = build_movie_detail(movie)
+    _movie_detail_cache[movie_id] = (time.monotonic() + MOVIE_DETAIL_CACHE_TTL, payload)
+    _movie_detail_cache.move_to_end(movie_id)
+    while len(_movie_detail_cache) > MOVIE_DETAIL_CACHE_MAX:
+        _movie_detail_cache.popitem(last=False)
+    return payload
+
+
+async def get_or_create(db: AsyncSession, model, field: str, value: str):
+    """
+    Fetch an instance of `model` whose `field` equals `value`, creating it
+    if it does not exist yet.
+
+    :param db: The async database session.
+    :param model: The SQLAlchemy model class (e.g. GenreModel).
+    :param field: The unique field name to match on (e.g. "name").
+    :param value: The value to look up or create.
+    :return: The existing or newly created model instance.
+    """
+    result = await db.execute(select(model).where(getattr(model, field) == value))
+    obj = result.scalars().first()
+    if obj is None:
+        obj = model(**{field: value})
+        db.add(obj)
+        await db.flush()
+    return obj
+
+
+async def bulk_lookup(
+        db: AsyncSession,
+        model,
+        field: str,
+        values: list[str]
+) -> dict:
+    """
+    Fetch the existing instances of `model` whose `field` matches any of
+    `values` with a single `IN` query.
+
+    :param db: The async database session.
+    :param model: The SQLAlchemy model class (e.g. GenreModel).
+    :param field: The unique field name to match on (e.g. "name").
+    :param values: The values to look up.
+    :return: A dict mapping each found value to its model instance.
+    """
+    values = list(dict.fromkeys(values))
+    if not values:
+        return {}
+
+    result = await db.execute(select(model).where(getattr(model, field).in_(values)))
+    return {getattr(obj, field): obj for obj in result.scalars().all()}
+
+
+async def bulk_create_missing(
+        db: AsyncSession,
+        model,
+        field: str,
+        values: list[str],
+        found: dict
+) -> list:
+    """
+    Create every value from `values` that is absent from `found` with one
+    multi-row INSERT and one re-fetch, then return instances for all
+    values in their original order.
+
+    Together with `bulk_lookup` this keeps the round-trip count constant
+    regardless of how many values are requested, instead of one SELECT
+    (plus possible INSERT and flush) per value.
+
+    :param db: The async database session.
+    :param model: The SQLAlchemy model class (e.g. GenreModel).
+    :param field: The unique field name to match on (e.g. "name").
+    :param values: The values that must all exist after this call.
+    :param found: The existing instances as returned by `bulk_lookup`.
+    :return: Model instances in the same order as `values`.
+    """
+    values = list(dict.fromkeys(values))
+    missing = [value for value in values if value not in found]
+    if missing:
+        await db.execute(insert(model).values([{field: value} for value in missing]))
+        result = await db.execute(select(model).where(getattr(model, field).in_(missing)))
+        for obj in result.scalars().all():
+            found[getattr(obj, field)] = obj
+
+    return [found[value] for value in values]
+
+
+async def create_film(db: AsyncSession, movie_data: MovieCreateSchema) -> MovieModel:
+    """
+    Create a new movie together with its related country, genres, actors
+    and languages, creating any related entities that do not exist yet.
+
+    :param db: The async database session.
+    :param movie_data: The validated movie payload.
+    :return: The newly created movie with all relations loaded.
+    :raises HTTPException: 409 error if a movie with the same name and date
+        already exists, 400 error on other integrity violations.
+    """
+    existing_stmt = select(MovieModel).where(
+        MovieModel.name == movie_data.name,
+        MovieModel.date == movie_data.date
+    )
+    existing_result = await db.execute(existing_stmt)
+    if existing_result.scalars().first():
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"A movie with the name '{movie_data.name}' and release date "
+                f"'{movie_data.date}' already exists."
+            )
+        )
+
+    try:
+        country = await get_or_create(db, CountryModel, "code", movie_data.country)
+
+        # The three lookups are independent, but a single AsyncSession does
+        # not permit concurrent statements (and a second connection would
+        # not share this transaction), so instead of asyncio.gather they
+        # run back-to-back before any dependent INSERT work.
+        genre_map = await bulk_lookup(db, GenreModel, "name", movie_data.genres)
+        actor_map = await bulk_lookup(db, ActorModel, "name", movie_data.actors)
+        language_map = await bulk_lookup(db, LanguageModel, "name", movie_data.languages)
+
+        genres = await bulk_create_missing(db, GenreModel, "name", movie_data.genres, genre_map)
+        actors = await bulk_create_missing(db, ActorModel, "name", movie_data.actors, actor_map)
+        languages = await bulk_create_missing(
+            db, LanguageModel, "name", movie_data.languages, language_map
+        )
+
+        movie = MovieModel(
+            name=movie_data.name,
+            date=movie_data.date,
+            score=movie_data.score,
+            overview=movie_data.overview,
+            status=movie_data.status,
+            budget=movie_data.budget,
+            revenue=movie_data.revenue,
+            country=country,
+            genres=genres,
+            actors=actors,
+            languages=languages,
+        )
+        db.add(movie)
+        await db.commit()
+        invalidate_obj_count(MovieModel)
+        # No post-commit refresh: the relationship collections were
+        # assigned from already-loaded instances, the id was populated by
+        # the INSERT at flush, and expire_on_commit=False keeps all of it
+        # live after the commit.
+        return movie
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
+
+
+async def delete_movie(db: AsyncSession, movie_id: int) -> None:
+    """
+    Delete the movie with the given id.
+
+    :param db: The async database session.
+    :param movie_id: The id of the movie to delete.
+    :raises HTTPException: 404 error if no movie with the given id exists.
+    """
+    result = await db.execute(
+        delete(MovieModel)
+        .where(MovieModel.id == movie_id)
+        .returning(MovieModel.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Movie with the given ID was not found."
+        )
+    await db.commit()
+    invalidate_obj_count(MovieModel)
+    invalidate_movie_detail(movie_id)
+
+
+async def update_movie(
+        db: AsyncSession,
+        movie_id: int,
+        movie_data: MovieUpdateSchema
+) -> None:
+    """
+    Apply a partial update to the movie with the given id.
+
+    :param db: The async database session.
+    :param movie_id: The id of the movie to update.
+    :param movie_data: The validated partial update payload.
+    :raises HTTPException: 404 error if no movie with the given id exists,
+        400 error on integrity violations.
+    """
+    data = movie_data.model_dump(exclude_unset=True)
+
+    if not data:
+        result = await db.execute(select(MovieModel.id).where(MovieModel.id == movie_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Movie with the given ID was not found."
+            )
+        return
+
+    try:
+        result = await db.execute(
+            update(MovieModel)
+            .where(MovieModel.id == movie_id)
+            .values(**data)
+            .returning(MovieModel.id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Movie with the given ID was not found."
+            )
+        await db.commit()
+        invalidate_movie_detail(movie_id)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
@@ -8,6 +8,7 @@ from database import (
 )
 from database.populate import CSVDatabaseSeeder
 from main import app
+from services import crud
 
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
@@ -19,6 +20,8 @@ async def reset_db():
     It helps maintain test isolation by preventing data leakage between tests.
     """
     await reset_database()
+    crud.invalidate_obj_count()
+    crud.invalidate_movie_detail()
 
 
 @pytest_asyncio.fixture(scope="function")
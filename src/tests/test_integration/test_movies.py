@@ -1,3 +1,4 @@
+import json
 import random
 
 import pytest
@@ -222,6 +223,84 @@ async def test_movie_list_with_pagination(client, db_session, seed_database):
     assert response_data["next_page"] == expected_next_page, "Next page link mismatch."
 
 
+@pytest.mark.asyncio
+async def test_movie_list_with_cursor_pagination(client, db_session, seed_database):
+    """
+    Test that following `next_cursor` returns the next page of movies
+    in descending `id` order without gaps or overlaps.
+    """
+    per_page = 5
+
+    first_response = await client.get(f"/api/v1/theater/movies/?per_page={per_page}")
+    assert first_response.status_code == 200, f"Expected status code 200, but got {first_response.status_code}"
+
+    first_data = first_response.json()
+    next_cursor = first_data["next_cursor"]
+    assert next_cursor is not None, "Expected next_cursor to be present on the first page."
+
+    second_response = await client.get(f"/api/v1/theater/movies/?per_page={per_page}&cursor={next_cursor}")
+    assert second_response.status_code == 200, f"Expected status code 200, but got {second_response.status_code}"
+
+    second_data = second_response.json()
+
+    stmt = select(MovieModel).order_by(MovieModel.id.desc()).offset(per_page).limit(per_page)
+    result = await db_session.execute(stmt)
+    expected_movies = result.scalars().all()
+
+    expected_movie_ids = [movie.id for movie in expected_movies]
+    returned_movie_ids = [movie["id"] for movie in second_data["movies"]]
+
+    assert returned_movie_ids == expected_movie_ids, (
+        f"Cursor page mismatch. Expected: {expected_movie_ids}, but got: {returned_movie_ids}"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_movie_list_with_invalid_cursor(client, seed_database, stream):
+    """
+    Test that a malformed `cursor` value results in a 400 error,
+    both for the paginated and the streaming variant.
+    """
+    response = await client.get(f"/api/v1/theater/movies/?cursor=not-a-cursor&stream={stream}")
+
+    assert response.status_code == 400, f"Expected status code 400, but got {response.status_code}"
+
+    response_data = response.json()
+    assert response_data == {"detail": "Invalid cursor."}, (
+        f"Expected error message not found. Got: {response_data}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_movie_list_streaming(client, db_session, seed_database):
+    """
+    Test that `stream=true` returns all movies as NDJSON lines
+    in descending `id` order.
+    """
+    response = await client.get("/api/v1/theater/movies/?stream=true")
+
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-type"].startswith("application/x-ndjson"), (
+        f"Expected NDJSON content type, but got {response.headers['content-type']}"
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+
+    count_stmt = select(func.count(MovieModel.id))
+    count_result = await db_session.execute(count_stmt)
+    total_items = count_result.scalar_one()
+
+    assert len(lines) == total_items, (
+        f"Expected {total_items} streamed movies, but got {len(lines)}"
+    )
+
+    returned_movie_ids = [movie["id"] for movie in lines]
+    assert returned_movie_ids == sorted(returned_movie_ids, reverse=True), (
+        "Streamed movies are not sorted by `id` in descending order."
+    )
+
+
 @pytest.mark.asyncio
 async def test_movies_fields_match_schema(client, db_session, seed_database):
     """